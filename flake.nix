@@ -60,8 +60,10 @@
               blackboxprotobuf
               ebooklib
               httpx
+              h2
               importlib-resources
               lxml
+              orjson
               pycryptodome
               rich
               tomli
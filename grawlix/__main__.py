@@ -138,13 +138,28 @@ async def download_series(source: Source, series: Series, args, config: Config)
     template = args.output or config.output or "{series}/{title}.{ext}"
     # Check both CLI flag and config file
     write_metadata = args.write_metadata_to_epub or config.write_metadata_to_epub
-    with logging.progress(series.title, source.name, len(series.book_ids)) as progress:
-        for book_id in series.book_ids:
-            try:
-                book: Book = await source.download_book_from_id(book_id)
-                await download_with_progress(book, progress, template, write_metadata)
-            except AccessDenied as error:
-                logging.info("Skipping - Access Denied")
+    book_ids = series.book_ids
+    with logging.progress(series.title, source.name, len(book_ids)) as progress:
+        # Data of the next book is fetched while the current book downloads.
+        # Only one book is fetched ahead, so signed file urls are used soon
+        # after they are created.
+        next_book: Optional[asyncio.Task] = None
+        try:
+            for index, book_id in enumerate(book_ids):
+                current_book = next_book or asyncio.create_task(source.download_book_from_id(book_id))
+                next_book = None
+                try:
+                    book: Book = await current_book
+                    if index + 1 < len(book_ids):
+                        next_book = asyncio.create_task(
+                            source.download_book_from_id(book_ids[index + 1])
+                        )
+                    await download_with_progress(book, progress, template, write_metadata)
+                except AccessDenied as error:
+                    logging.info("Skipping - Access Denied")
+        finally:
+            if next_book is not None:
+                next_book.cancel()
 
 
 
@@ -202,7 +217,18 @@ async def download_with_progress(book: Book, progress: Progress, template: str,
 
 def run() -> None:
     """Start main function"""
-    asyncio.run(main())
+    # Use the faster uvloop event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+        return
+    if hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        # uvloop versions before 0.18 only support installing the policy
+        uvloop.install()
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@ from dataclasses import dataclass, field
 from typing import Optional, Union, TypeVar, Generic, Any
 from datetime import date
 
+# Placeholder for missing metadata values in output paths
+_UNKNOWN = "UNKNOWN"
+
 @dataclass(slots=True)
 class Metadata:
     """Metadata about a book"""
@@ -28,19 +31,19 @@ class Metadata:
     def as_dict(self) -> dict:
         return {
             "title": self.title,
-            "series": self.series or "UNKNOWN",
-            "index": str(self.index) if self.index is not None else "UNKNOWN",
-            "publisher": self.publisher or "UNKNOWN",
-            "isbn": self.isbn or "UNKNOWN",
-            "language": self.language or "UNKNOWN",
-            "authors": "; ".join(self.authors),
-            "description": self.description or "UNKNOWN",
-            "release_date": self.release_date.isoformat() if self.release_date else "UNKNOWN",
-            "source": self.source or "UNKNOWN",
-            "original_title": self.original_title or "UNKNOWN",
-            "translators": "; ".join(self.translators),
-            "category": self.category or "UNKNOWN",
-            "tags": "; ".join(self.tags),
+            "series": self.series or _UNKNOWN,
+            "index": str(self.index) if self.index is not None else _UNKNOWN,
+            "publisher": self.publisher or _UNKNOWN,
+            "isbn": self.isbn or _UNKNOWN,
+            "language": self.language or _UNKNOWN,
+            "authors": "; ".join(self.authors) if self.authors else "",
+            "description": self.description or _UNKNOWN,
+            "release_date": self.release_date.isoformat() if self.release_date else _UNKNOWN,
+            "source": self.source or _UNKNOWN,
+            "original_title": self.original_title or _UNKNOWN,
+            "translators": "; ".join(self.translators) if self.translators else "",
+            "category": self.category or _UNKNOWN,
+            "tags": "; ".join(self.tags) if self.tags else "",
         }
 
 
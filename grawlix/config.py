@@ -1,38 +1,132 @@
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from typing import Optional
-import tomli
 from platformdirs import user_config_dir
 import os
+import sys
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class SourceConfig:
     """Stores configuration for source"""
     username: Optional[str]
     password: Optional[str]
 
+    @classmethod
+    def from_mapping(cls, values: dict) -> "SourceConfig":
+        """
+        Create source config from a source table in the config file
+
+        :param values: Values of source table
+        :returns: SourceConfig object
+        """
+        return cls(values.get("username"), values.get("password"))
+
+
+class _LazySources(Mapping[str, SourceConfig]):
+    """
+    Source configs from the config file
+    Each SourceConfig is only created when it is first accessed
+    """
+    __slots__ = ("_raw", "_built")
+
+    def __init__(self, raw: dict[str, dict]):
+        self._raw = raw
+        self._built: dict[str, SourceConfig] = {}
+
+    def __getitem__(self, key: str) -> SourceConfig:
+        source_config = self._built.get(key)
+        if source_config is None:
+            source_config = SourceConfig.from_mapping(self._raw[key])
+            self._built[key] = source_config
+        return source_config
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
 
-@dataclass(slots=True)
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._raw)!r})"
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """Grawlix configuration"""
-    sources: dict[str, SourceConfig]
+    sources: Mapping[str, SourceConfig]
     write_metadata_to_epub: bool = False
     output: Optional[str] = None
 
 
+# Last loaded config and the state of the file it was loaded from
+_config_cache: Optional[tuple[tuple, Config]] = None
+# Resolved path of config file
+_config_path: Optional[str] = None
+
+
 def load_config() -> Config:
     """
     Load config from disk
+    The parsed config is reused until the file changes
 
     :returns: Config object
     """
-    config_dir = user_config_dir("grawlix", "jo1gi")
-    config_file = os.path.join(config_dir, "grawlix.toml")
+    global _config_cache
+    config_file = _get_config_path()
+    try:
+        stat = os.stat(config_file)
+        file_state: tuple = (config_file, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_state = (config_file, None, None)
+    if _config_cache is not None and _config_cache[0] == file_state:
+        return _config_cache[1]
+    config = _read_config(config_file)
+    _config_cache = (file_state, config)
+    return config
+
+
+def _get_config_path() -> str:
+    """
+    Find path of config file, resolved on first use
+
+    :returns: Path to config file
+    """
+    global _config_path
+    if _config_path is None:
+        config_dir = user_config_dir("grawlix", "jo1gi")
+        _config_path = os.path.join(config_dir, "grawlix.toml")
+    return _config_path
+
+
+def clear_config_cache() -> None:
+    """
+    Forget cached config and config path, so the next `load_config` resolves
+    and reads the file again
+    """
+    global _config_cache, _config_path
+    _config_cache = None
+    _config_path = None
+
+
+def _read_config(config_file: str) -> Config:
+    """
+    Read and parse config file
+
+    :param config_file: Path to config file
+    :returns: Config object
+    """
     if os.path.exists(config_file):
+        with open(config_file, "rb") as f:
+            data = f.read()
         try:
-            with open(config_file, "rb") as f:
-                config_dict = tomli.load(f)
-        except tomli.TOMLDecodeError as e:
+            return parse_config(data)
+        except tomllib.TOMLDecodeError as e:
             print(f"Error parsing config file: {config_file}")
             print(f"  {e}")
             print("\nPlease check your TOML syntax. Common issues:")
@@ -40,15 +134,18 @@ def load_config() -> Config:
             print("  - Booleans are lowercase: write_metadata_to_epub = true (not True)")
             print("  - Use double quotes for strings containing special characters")
             raise
-    else:
-        config_dict = {}
-    sources = {}
-    if "sources" in config_dict:
-        for key, values in config_dict["sources"].items():
-            sources[key] = SourceConfig (
-                username = values.get("username"),
-                password = values.get("password"),
-            )
+    return parse_config(b"")
+
+
+def parse_config(data: bytes) -> Config:
+    """
+    Parse content of config file
+
+    :param data: TOML encoded config
+    :returns: Config object
+    """
+    config_dict = tomllib.loads(data.decode())
+    sources = _LazySources(config_dict.get("sources", {}))
 
     # Load general settings
     write_metadata_to_epub = config_dict.get("write_metadata_to_epub", False)
@@ -1,6 +1,30 @@
 from Crypto.Cipher import AES
-from typing import Union, Protocol
+from typing import Union, Protocol, Optional, Any
 from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(slots=True)
+class StreamDecryptor:
+    """
+    Decrypts data incrementally as it arrives
+
+    Input is buffered so the cipher only receives whole blocks
+    """
+    cipher: Any
+    block_size: int = 1
+    buffer: bytes = b""
+
+    def update(self, data: bytes) -> bytes:
+        if self.buffer:
+            data = self.buffer + data
+        usable = len(data) - len(data) % self.block_size
+        self.buffer = data[usable:]
+        return self.cipher.decrypt(data[:usable]) if usable else b""
+
+    def finalize(self) -> bytes:
+        rest, self.buffer = self.buffer, b""
+        return self.cipher.decrypt(rest) if rest else b""
 
 
 @dataclass(slots=True)
@@ -9,8 +33,15 @@ class AESEncryption:
     iv: bytes
 
     def decrypt(self, data: bytes) -> bytes:
-        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-        return cipher.decrypt(data)
+        return self._new_cipher().decrypt(data)
+
+    def stream(self) -> StreamDecryptor:
+        return StreamDecryptor(self._new_cipher(), AES.block_size)
+
+    def _new_cipher(self) -> Any:
+        # Chaining state is consumed while decrypting, so every use needs a
+        # fresh cipher
+        return AES.new(self.key, AES.MODE_CBC, self.iv)
 
 
 @dataclass(slots=True)
@@ -20,13 +51,20 @@ class AESCTREncryption:
     initial_value: bytes
 
     def decrypt(self, data: bytes) -> bytes:
-        cipher = AES.new(
+        return self._new_cipher().decrypt(data)
+
+    def stream(self) -> StreamDecryptor:
+        return StreamDecryptor(self._new_cipher())
+
+    def _new_cipher(self) -> Any:
+        # Counter state is consumed while decrypting, so every use needs a
+        # fresh cipher
+        return AES.new(
             key = self.key,
             mode = AES.MODE_CTR,
             nonce = self.nonce,
             initial_value = self.initial_value
         )
-        return cipher.decrypt(data)
 
 
 @dataclass(slots=True)
@@ -34,11 +72,27 @@ class XOrEncryption:
     key: bytes
 
     def decrypt(self, data: bytes) -> bytes:
-        key_length = len(self.key)
-        decoded = []
-        for i in range(0, len(data)):
-            decoded.append(data[i] ^ self.key[i % key_length])
-        return bytes(decoded)
+        length = len(data)
+        if length == 0:
+            return b""
+        if len(self.key) == 1:
+            return data.translate(_xor_table(self.key[0]))
+        # Repeat key to the length of the data and xor both as big integers
+        key = (self.key * (length // len(self.key) + 1))[:length]
+        decoded = int.from_bytes(data, "little") ^ int.from_bytes(key, "little")
+        return decoded.to_bytes(length, "little")
+
+
+@lru_cache(maxsize=256)
+def _xor_table(key_byte: int) -> bytes:
+    """
+    Create translation table for xor with a single byte
+    Xor with a single byte maps every byte value to one other value
+
+    :param key_byte: Byte to xor with
+    :returns: Table for `bytes.translate`
+    """
+    return bytes(b ^ key_byte for b in range(256))
 
 
 class Encryption(Protocol):
@@ -54,3 +108,14 @@ def decrypt(data: bytes, encryption: Encryption) -> bytes:
     :returns: Decrypted data
     """
     return encryption.decrypt(data)
+
+
+def stream_decryptor(encryption: Encryption) -> Optional[StreamDecryptor]:
+    """
+    Create decryptor for decrypting data in chunks
+
+    :param encryption: Information about how to decrypt
+    :returns: Decryptor if the encryption supports streaming
+    """
+    stream = getattr(encryption, "stream", None)
+    return stream() if stream is not None else None
@@ -8,10 +8,40 @@ from .cbz import Cbz
 from .epub import Epub
 from .pdf import Pdf
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Optional
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 import os
-import platform
+import re
+
+# Resolved once, the platform can't change while running
+_IS_WINDOWS = os.name == "nt"
+
+# Null bytes and control characters are removed on all platforms
+_CONTROL_CHARS = {chr(c): None for c in (*range(0x20), 0x7f)}
+# Windows forbidden: < > : " / \ | ? *
+# Slashes are replaced with dash for better readability
+_WINDOWS_TABLE = str.maketrans({
+    **_CONTROL_CHARS,
+    **{char: '_' for char in '<>:"|?*'},
+    '/': '-',
+    '\\': '-',
+})
+# Unix-like systems (macOS, Linux)
+# Only / is truly forbidden, but : can cause issues on some versions of macOS
+_UNIX_TABLE = str.maketrans({
+    **_CONTROL_CHARS,
+    '/': '-',
+    ':': '-',
+})
+
+# Windows reserved names (case-insensitive)
+_WINDOWS_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
 
 async def download_book(book: Book, update_func: Callable, template: str) -> None:
     """
@@ -45,8 +75,20 @@ def format_output_location(book: Book, output_format: OutputFormat, template: st
     :param template: Template for output path (supports ~, environment variables, and absolute paths)
     :returns: Output path
     """
-    values = { key: remove_unwanted_chars(value) for key, value in book.metadata.as_dict().items() }
-    path = template.format(**values, ext = output_format.extension)
+    # Templates often only use `{ext}`, which doesn't need metadata
+    simple_path = template.replace("{ext}", output_format.extension)
+    if "{" not in simple_path and "}" not in simple_path:
+        # Nothing else to substitute
+        path = simple_path
+    else:
+        metadata = book.metadata.as_dict()
+        # Only sanitize the values used in the template
+        values = {
+            key: remove_unwanted_chars(metadata[key])
+            for key in _template_fields(template)
+            if key in metadata
+        }
+        path = template.format(**values, ext = output_format.extension)
 
     # Expand user home directory (~/... or ~user/...)
     path = os.path.expanduser(path)
@@ -60,17 +102,49 @@ def format_output_location(book: Book, output_format: OutputFormat, template: st
     return path
 
 
+@lru_cache(maxsize=None)
+def _template_fields(template: str) -> frozenset[str]:
+    """
+    Find names of fields used in output template
+
+    :param template: Template for output path
+    :returns: Names of referenced fields
+    """
+    fields = set()
+    for _, field_name, _, _ in Formatter().parse(template):
+        if field_name:
+            # Strip attribute access and indexing (`{title[0]}`)
+            fields.add(field_name.partition(".")[0].partition("[")[0])
+    return frozenset(fields)
+
+
 def remove_strings(input: str, strings: Iterable[str]) -> str:
     """
     Remove strings from input
 
     :param input: the string to remove strings from
     :param strings: the list of strings to remove from input
-    :returns: input without strinfs
+    :returns: input without strings
     """
-    for c in strings:
-        input = input.replace(c, "")
-    return input
+    pattern = _removal_pattern(tuple(strings))
+    if pattern is None:
+        return input
+    return pattern.sub("", input)
+
+
+@lru_cache(maxsize=256)
+def _removal_pattern(strings: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile regex matching any of the given strings, so they can be removed
+    in a single pass
+
+    :param strings: Strings to match, earlier strings take precedence
+    :returns: Compiled regex or None if there is nothing to match
+    """
+    strings = tuple(string for string in strings if string)
+    if not strings:
+        return None
+    return re.compile("|".join(map(re.escape, strings)))
 
 
 def remove_unwanted_chars(input: str) -> str:
@@ -81,53 +155,28 @@ def remove_unwanted_chars(input: str) -> str:
     :param input: The string to sanitize
     :returns: Safe filename string
     """
-    import re
-
-    # Replace null bytes and control characters
-    output = re.sub(r'[\x00-\x1f\x7f]', '', input)
-
-    # Platform-specific forbidden characters - replace with underscore
-    if platform.system() == "Windows":
-        # Windows forbidden: < > : " / \ | ? *
-        forbidden_chars = '<>:"|?*'
-        for char in forbidden_chars:
-            output = output.replace(char, '_')
-        # Replace slashes with dash for better readability
-        output = output.replace('/', '-')
-        output = output.replace('\\', '-')
-
-        # Windows reserved names (case-insensitive)
-        reserved_names = {
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        }
+    # Remove control characters and replace platform-specific forbidden
+    # characters in a single pass
+    if _IS_WINDOWS:
+        output = input.translate(_WINDOWS_TABLE)
+
         # Check if the name (without extension) is reserved
         name_part = output.split('.')[0].upper()
-        if name_part in reserved_names:
+        if name_part in _WINDOWS_RESERVED_NAMES:
             output = f"_{output}"
 
         # Remove trailing spaces and periods (Windows doesn't allow these)
         output = output.rstrip('. ')
 
     else:
-        # Unix-like systems (macOS, Linux)
-        # Only / is truly forbidden, but : can cause issues on macOS
-        output = output.replace('/', '-')
-        # Some versions of macOS have issues with :
-        output = output.replace(':', '-')
+        output = input.translate(_UNIX_TABLE)
 
     # Remove leading/trailing whitespace
     output = output.strip()
 
     # Limit filename length (most filesystems have 255 byte limit)
     # Reserve some space for extensions and numbering
-    max_length = 200
-    if len(output.encode('utf-8')) > max_length:
-        # Truncate while respecting UTF-8 character boundaries
-        output_bytes = output.encode('utf-8')[:max_length]
-        # Decode, ignoring partial characters at the end
-        output = output_bytes.decode('utf-8', errors='ignore').rstrip()
+    output = _truncate_utf8(output, 200)
 
     # Ensure we don't return an empty string
     if not output:
@@ -136,6 +185,24 @@ def remove_unwanted_chars(input: str) -> str:
     return output
 
 
+def _truncate_utf8(input: str, max_length: int) -> str:
+    """
+    Truncate string to a maximum number of bytes when encoded as UTF-8
+
+    :param input: String to truncate
+    :param max_length: Maximum length in bytes
+    :returns: Truncated string without partial characters or trailing whitespace
+    """
+    # A character is at most 4 bytes in UTF-8
+    if len(input) * 4 <= max_length:
+        return input
+    output_bytes = input.encode('utf-8')
+    if len(output_bytes) <= max_length:
+        return input
+    # Decode, ignoring partial characters at the end
+    return output_bytes[:max_length].decode('utf-8', errors='ignore').rstrip()
+
+
 def get_default_format(book: Book) -> OutputFormat:
     """
     Get default output format for bookdata.
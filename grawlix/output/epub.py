@@ -5,79 +5,167 @@ from .output_format import OutputFormat, Update
 import asyncio
 import os
 import re
-import xml.etree.ElementTree as ET
-from zipfile import ZipFile
+from io import BytesIO
+from typing import IO, Iterator, Optional, Union
+from zipfile import ZipFile, ZipInfo
 
 from bs4 import BeautifulSoup
 from ebooklib import epub
+from lxml import etree
 import rich
 
 
-def _fix_fixed_layout_page(html_content: bytes, css_content: bytes = None) -> bytes:
+_BROKEN_STYLE_RE = re.compile(rb'style="width:px;\s*height:px;"')
+_IMG_SRC_RE = re.compile(rb'<img[^>]+src=["\']([^"\']+)["\']')
+
+# Epub parts larger than this are written to a temporary file instead of kept in memory
+_IN_MEMORY_PART_LIMIT = 50 * 1024 * 1024
+# Number of epub parts downloaded ahead of the part being processed
+_PART_LOOKAHEAD = 4
+
+_OPF_NS = '{http://www.idpf.org/2007/opf}'
+_OPF_METADATA = f'{_OPF_NS}metadata'
+_OPF_META = f'{_OPF_NS}meta'
+_OPF_MANIFEST = f'{_OPF_NS}manifest'
+_OPF_ITEM = f'{_OPF_NS}item'
+_OPF_SPINE = f'{_OPF_NS}spine'
+_OPF_ITEMREF = f'{_OPF_NS}itemref'
+# Meta and itemref elements are matched in any namespace, like `Element.iter`
+# based parsing did before
+_OPF_TAGS = (_OPF_METADATA, _OPF_MANIFEST, _OPF_SPINE, _OPF_ITEM, '{*}meta', '{*}itemref')
+
+
+def _find_body_size(css: str, name: str) -> Optional[str]:
+    """
+    Find the pixel value of a property in the body rule of a stylesheet
+
+    Matches the last `<name>: <digits>px` declaration inside `body { ... }`
+    """
+    key = f'{name}:'
+    body = css.find('body')
+    while body != -1:
+        open_brace = css.find('{', body + 4)
+        if open_brace == -1:
+            return None
+        if not css[body + 4:open_brace].strip():
+            close_brace = css.find('}', open_brace)
+            if close_brace == -1:
+                close_brace = len(css)
+            index = css.rfind(key, open_brace, close_brace)
+            while index != -1:
+                start = index + len(key)
+                while start < close_brace and css[start].isspace():
+                    start += 1
+                end = start
+                while end < close_brace and css[end].isdigit():
+                    end += 1
+                if end > start and css.startswith('px', end):
+                    return css[start:end]
+                index = css.rfind(key, open_brace, index)
+        body = css.find('body', body + 1)
+    return None
+
+
+def _fix_fixed_layout_page(html_content: bytes, css_content: Optional[str] = None) -> bytes:
     """
     Fix fixed-layout XHTML pages by adding viewport and fixing broken styles.
 
     Extracts dimensions from CSS and applies them to viewport and inline styles.
     """
-    try:
-        html_str = html_content.decode('utf-8')
-    except UnicodeDecodeError:
-        return html_content
-
     # Extract dimensions from CSS if provided
     width = None
     height = None
     if css_content:
-        try:
-            css_str = css_content.decode('utf-8')
-            # Look for body width/height
-            width_match = re.search(r'body\s*\{[^}]*width:\s*(\d+)px', css_str)
-            height_match = re.search(r'body\s*\{[^}]*height:\s*(\d+)px', css_str)
-            if width_match:
-                width = width_match.group(1)
-            if height_match:
-                height = height_match.group(1)
-        except UnicodeDecodeError:
-            pass
+        # Look for body width/height
+        width = _find_body_size(css_content, 'width')
+        height = _find_body_size(css_content, 'height')
 
     if not width or not height:
         return html_content
 
     # Add viewport meta tag if missing
-    if 'name="viewport"' not in html_str and '<head>' in html_str:
-        viewport_tag = f'<meta name="viewport" content="width={width}, height={height}"/>'
-        html_str = html_str.replace('<head>', f'<head>\n    {viewport_tag}', 1)
+    if b'name="viewport"' not in html_content and b'<head>' in html_content:
+        viewport_tag = f'<meta name="viewport" content="width={width}, height={height}"/>'.encode()
+        html_content = html_content.replace(b'<head>', b'<head>\n    ' + viewport_tag, 1)
 
     # Fix broken inline styles (width:px; height:px;)
-    html_str = re.sub(
-        r'style="width:px;\s*height:px;"',
-        f'style="width:{width}px; height:{height}px;"',
-        html_str
-    )
-
-    return html_str.encode('utf-8')
-
-
-def _get_css_rule_key(rule_text: str) -> str | None:
-    """Get unique key for a CSS rule. For @font-face, include font-family."""
-    selector = rule_text.split('{')[0].strip()
-    if selector == '@font-face':
-        # Extract font-family to distinguish different font-faces
-        match = re.search(r'font-family:\s*["\']?([^"\';}]+)', rule_text)
-        if match:
-            return f'@font-face:{match.group(1).strip()}'
-        return None  # Skip font-face without font-family
-    return selector if selector else None
-
-
-def _extract_opf_metadata(opf_content: bytes) -> dict:
+    fixed_style = f'style="width:{width}px; height:{height}px;"'.encode()
+    return _BROKEN_STYLE_RE.sub(fixed_style, html_content)
+
+
+def _find_font_family(block: str) -> Optional[str]:
+    """Find the value of the font-family property in a CSS declaration block"""
+    index = block.find('font-family:')
+    if index == -1:
+        return None
+    start = index + len('font-family:')
+    end = len(block)
+    while start < end and block[start].isspace():
+        start += 1
+    if start < end and block[start] in '"\'':
+        start += 1
+    stop = start
+    while stop < end and block[stop] not in '"\';}':
+        stop += 1
+    return block[start:stop].strip() or None
+
+
+def _iter_css_rules(css: str) -> Iterator[tuple[str, str]]:
     """
-    Extract rendition properties, cover info, and spine properties from OPF content.
+    Split CSS into top-level rules in a single scan.
 
-    Returns dict with keys: rendition_layout, rendition_spread,
-    rendition_orientation, cover_id, cover_href, spine_properties
+    Yields (key, rule) pairs where key identifies the rule when merging.
+    For @font-face the font-family is included in the key, and font-faces
+    without a font-family are skipped.
     """
-    result = {
+    start = 0
+    length = len(css)
+    while start < length:
+        open_brace = css.find('{', start)
+        if open_brace == -1:
+            return
+        # Find the matching closing brace, skipping over nested blocks
+        depth = 1
+        position = open_brace + 1
+        while depth:
+            close_brace = css.find('}', position)
+            if close_brace == -1:
+                position = length
+                break
+            nested = css.find('{', position, close_brace)
+            if nested == -1:
+                depth -= 1
+                position = close_brace + 1
+            else:
+                depth += 1
+                position = nested + 1
+        selector = css[start:open_brace].strip()
+        rule = css[start:position].strip()
+        if depth:
+            rule += '}'
+        start = position
+        if selector == '@font-face':
+            font_family = _find_font_family(css[open_brace:position])
+            if font_family is None:
+                continue
+            yield f'@font-face:{font_family}', rule
+        elif selector:
+            yield selector, rule
+
+
+def _merge_css(existing: str, new: str) -> str:
+    """Combine rules from two stylesheets, keeping the longer version of duplicate rules"""
+    rules = dict(_iter_css_rules(existing))
+    for key, rule in _iter_css_rules(new):
+        current = rules.get(key)
+        if current is None or len(rule) > len(current):
+            rules[key] = rule
+    return '\n'.join(rules.values())
+
+
+def _empty_opf_metadata() -> dict:
+    """Default result of `_extract_opf_metadata`"""
+    return {
         'rendition_layout': None,
         'rendition_spread': None,
         'rendition_orientation': None,
@@ -86,46 +174,53 @@ def _extract_opf_metadata(opf_content: bytes) -> dict:
         'spine_properties': {},  # Maps href -> properties (e.g., 'page-spread-left')
     }
 
+
+def _extract_opf_metadata(opf_file: IO[bytes]) -> dict:
+    """
+    Extract rendition properties, cover info, and spine properties from OPF file.
+
+    Returns dict with keys: rendition_layout, rendition_spread,
+    rendition_orientation, cover_id, cover_href, spine_properties
+    """
+    result = _empty_opf_metadata()
+    id_to_href = {}
+    # Metas can be nested in <x-metadata> or <dc-metadata> in OPF 2, so track
+    # which section is open instead of checking the direct parent
+    in_metadata = in_manifest = in_spine = False
     try:
-        root = ET.fromstring(opf_content)
-        ns = {
-            'opf': 'http://www.idpf.org/2007/opf',
-            'dc': 'http://purl.org/dc/elements/1.1/',
-        }
-
-        # Find metadata element
-        metadata = root.find('opf:metadata', ns)
-        if metadata is None:
-            metadata = root.find('{http://www.idpf.org/2007/opf}metadata')
-        if metadata is None:
-            return result
-
-        # Extract rendition properties from <meta property="rendition:X">
-        for meta in metadata.iter():
-            if meta.tag.endswith('}meta') or meta.tag == 'meta':
-                prop = meta.get('property', '')
+        # Single pass over the package document, stopping once the spine is done
+        for event, elem in etree.iterparse(opf_file, events=('start', 'end'), tag=_OPF_TAGS, resolve_entities=False):
+            tag = elem.tag
+            if event == 'start':
+                if tag == _OPF_METADATA:
+                    in_metadata = True
+                elif tag == _OPF_MANIFEST:
+                    in_manifest = True
+                elif tag == _OPF_SPINE:
+                    in_spine = True
+                continue
+            if tag == _OPF_SPINE:
+                break
+            if tag == _OPF_METADATA:
+                in_metadata = False
+            elif tag == _OPF_MANIFEST:
+                in_manifest = False
+            elif in_metadata and tag.rpartition('}')[2] == 'meta':
+                # Extract rendition properties from <meta property="rendition:X">
+                prop = elem.get('property', '')
                 if prop == 'rendition:layout':
-                    result['rendition_layout'] = meta.text
+                    result['rendition_layout'] = elem.text
                 elif prop == 'rendition:spread':
-                    result['rendition_spread'] = meta.text
+                    result['rendition_spread'] = elem.text
                 elif prop == 'rendition:orientation':
-                    result['rendition_orientation'] = meta.text
+                    result['rendition_orientation'] = elem.text
 
                 # Cover reference: <meta name="cover" content="image-id"/>
-                name = meta.get('name', '')
-                if name == 'cover':
-                    result['cover_id'] = meta.get('content')
-
-        # Parse manifest once for cover info and id->href mapping
-        manifest = root.find('opf:manifest', ns)
-        if manifest is None:
-            manifest = root.find('{http://www.idpf.org/2007/opf}manifest')
-
-        id_to_href = {}
-        if manifest is not None:
-            for item in manifest.iter():
-                item_id = item.get('id')
-                item_href = item.get('href')
+                if elem.get('name', '') == 'cover':
+                    result['cover_id'] = elem.get('content')
+            elif in_manifest and tag == _OPF_ITEM:
+                item_id = elem.get('id')
+                item_href = elem.get('href')
                 if item_id and item_href:
                     id_to_href[item_id] = item_href
 
@@ -134,27 +229,20 @@ def _extract_opf_metadata(opf_content: bytes) -> dict:
                     result['cover_href'] = item_href
 
                 # Check for cover-image property
-                props = item.get('properties', '')
+                props = elem.get('properties', '')
                 if 'cover-image' in props and not result['cover_href']:
                     result['cover_href'] = item_href
                     result['cover_id'] = item_id
-
-        # Extract spine properties (page-spread-left, page-spread-right)
-        spine = root.find('opf:spine', ns)
-        if spine is None:
-            spine = root.find('{http://www.idpf.org/2007/opf}spine')
-        if spine is not None:
-            # Extract spine itemref properties
-            for itemref in spine.iter():
-                if itemref.tag.endswith('}itemref') or itemref.tag == 'itemref':
-                    idref = itemref.get('idref')
-                    props = itemref.get('properties')
-                    if idref and props and idref in id_to_href:
-                        href = id_to_href[idref]
-                        result['spine_properties'][href] = props
-
-    except ET.ParseError:
-        pass
+            elif in_spine and tag.rpartition('}')[2] == 'itemref':
+                # Extract spine properties (page-spread-left, page-spread-right)
+                idref = elem.get('idref')
+                props = elem.get('properties')
+                if idref and props and idref in id_to_href:
+                    href = id_to_href[idref]
+                    result['spine_properties'][href] = props
+            elem.clear()
+    except etree.XMLSyntaxError:
+        return _empty_opf_metadata()
 
     return result
 
@@ -236,16 +324,16 @@ class Epub(OutputFormat):
         files = data.files
         file_count = len(files)
         progress = 1/(file_count)
-        temporary_file_location = f"{location}.tmp"
 
         added_files: dict[str, int] = {}  # Track filepath -> content size
         opf_metadata: dict = {}
-        css_cache: dict[str, bytes] = {}  # Store CSS content for fixing HTML pages
+        css_cache: dict[str, str] = {}  # Store CSS content for fixing HTML pages
         cover_href: str = None  # Store cover image path from OPF
-        spine_properties: dict[str, str] = {}  # Store spine properties (href -> properties)
+        spine_properties: dict[str, str] = {}  # Store spine properties (file name -> properties)
 
-        def should_add_file(zipfile: ZipFile, filename: str) -> bool:
+        def should_add_file(info: ZipInfo) -> bool:
             """Check if file should be added (new or larger than existing)"""
+            filename = info.filename
             # Skip directory entries, container files (ebooklib handles these), and OPF/NCX
             if filename.endswith("/"):
                 return False
@@ -256,20 +344,61 @@ class Epub(OutputFormat):
             if filename not in added_files:
                 return True
             # If file exists, only replace if new version is larger (non-empty beats empty)
-            new_size = zipfile.getinfo(filename).file_size
-            return new_size > added_files[filename]
+            return info.file_size > added_files[filename]
+
+        # Toc entries can point to an anchor in a file
+        toc_filenames = {key.split("#", 1)[0] for key in data.files_in_toc}
 
         output = epub.EpubBook()
         opf_extracted = False
-        for file in files:
-            await self._download_and_write_file(file, temporary_file_location)
-            with ZipFile(temporary_file_location, "r") as zipfile:
-                # Extract OPF metadata from first OPF file (before skipping)
-                if not opf_extracted:
-                    for filename in zipfile.namelist():
-                        if filename.endswith(".opf"):
-                            opf_content = zipfile.read(filename)
-                            opf_metadata = _extract_opf_metadata(opf_content)
+        # Non-html assets by path, added to the book after all parts are read
+        binary_items: dict[str, epub.EpubItem] = {}
+
+        # Download parts concurrently, but process them in order
+        async def download_part(index: int, file: OnlineFile) -> Union[str, BytesIO]:
+            content = await self._download_file(file)
+            # Keep small parts in memory, spill large ones to disk while they wait
+            if len(content) <= _IN_MEMORY_PART_LIMIT:
+                return BytesIO(content)
+            part_location = f"{location}.{index}.tmp"
+            with open(part_location, "wb") as f:
+                f.write(content)
+            return part_location
+
+        # Only a limited number of parts are downloaded ahead, so finished
+        # parts do not pile up while waiting to be processed
+        tasks: dict[int, asyncio.Task] = {}
+
+        def schedule_part(index: int) -> None:
+            if index < file_count:
+                tasks[index] = asyncio.create_task(download_part(index, files[index]))
+
+        for index in range(_PART_LOOKAHEAD):
+            schedule_part(index)
+        try:
+            for index in range(file_count):
+                part = await tasks.pop(index)
+                schedule_part(index + _PART_LOOKAHEAD)
+                try:
+                    with ZipFile(part, "r") as zipfile:
+                        # Sort entries in a single pass over the central directory.
+                        # OPF and CSS have to be handled before the content files,
+                        # since fixing fixed-layout pages depends on both.
+                        opf_infos: list[ZipInfo] = []
+                        css_infos: list[ZipInfo] = []
+                        content_infos: list[ZipInfo] = []
+                        for info in zipfile.infolist():
+                            if info.filename.endswith(".opf"):
+                                opf_infos.append(info)
+                            elif info.filename.endswith(".css"):
+                                css_infos.append(info)
+                            else:
+                                content_infos.append(info)
+
+                        # Extract OPF metadata from first OPF file (before skipping)
+                        if not opf_extracted and opf_infos:
+                            with zipfile.open(opf_infos[0]) as opf_file:
+                                opf_metadata = _extract_opf_metadata(opf_file)
                             # Store rendition properties in metadata
                             if opf_metadata.get('rendition_layout'):
                                 metadata.rendition_layout = opf_metadata['rendition_layout']
@@ -279,109 +408,93 @@ class Epub(OutputFormat):
                                 metadata.rendition_orientation = opf_metadata['rendition_orientation']
                             if opf_metadata.get('cover_href'):
                                 cover_href = opf_metadata['cover_href']
-                            if opf_metadata.get('spine_properties'):
-                                spine_properties.update(opf_metadata['spine_properties'])
+                            # Spine hrefs are relative to the OPF, so match them by file name
+                            for href, prop_value in opf_metadata['spine_properties'].items():
+                                spine_properties.setdefault(os.path.basename(href), prop_value)
                             opf_extracted = True
-                            break
-
-                # Collect CSS files, merging content from all parts
-                for filepath in zipfile.namelist():
-                    if filepath.endswith(".css"):
-                        content = zipfile.read(filepath)
-                        if not content:
-                            continue  # Skip empty files
-                        if filepath not in css_cache:
-                            css_cache[filepath] = content
-                        else:
-                            # Merge: combine rules, keeping the longer version for duplicate selectors
-                            existing_str = css_cache[filepath].decode('utf-8', errors='ignore')
-                            new_str = content.decode('utf-8', errors='ignore')
-
-                            # Parse existing rules into dict: key -> full rule
-                            existing_rules = {}
-                            for rule in existing_str.split('}'):
-                                if '{' in rule:
-                                    rule_key = _get_css_rule_key(rule)
-                                    if rule_key:
-                                        existing_rules[rule_key] = rule.strip() + '}'
-
-                            # Process new rules: add new ones, replace if longer
-                            for rule in new_str.split('}'):
-                                if '{' in rule:
-                                    rule_key = _get_css_rule_key(rule)
-                                    if rule_key:
-                                        new_rule = rule.strip() + '}'
-                                        if rule_key not in existing_rules or len(new_rule) > len(existing_rules[rule_key]):
-                                            existing_rules[rule_key] = new_rule
-
-                            # Rebuild CSS from merged rules
-                            css_cache[filepath] = '\n'.join(existing_rules.values()).encode('utf-8')
-
-                for filepath in zipfile.namelist():
-                    # Skip CSS files here - they'll be added after all parts are merged
-                    if filepath.endswith(".css"):
-                        continue
-                    if not should_add_file(zipfile, filepath):
-                        continue
-                    content = zipfile.read(filepath)
-                    file_size = len(content)
-                    if filepath.endswith("html"):
-                        filename = os.path.basename(filepath)
-                        # Fix fixed-layout pages if we have rendition:layout
-                        if metadata.rendition_layout == 'pre-paginated':
-                            # Find matching CSS (e.g., page1.xhtml -> page1.css)
-                            css_path = filepath.replace('.xhtml', '.css').replace('.html', '.css')
-                            css_content = css_cache.get(css_path)
-                            if css_content:
-                                content = _fix_fixed_layout_page(content, css_content)
-                        is_in_toc = False
-                        title = None
-                        for key, value in data.files_in_toc.items():
-                            toc_filename = key.split("#")[0]
-                            if filename == toc_filename:
-                                title = value
-                                is_in_toc = True
-                                break
-                        # Use EpubItem to preserve original content (link tags, viewport, etc.)
-                        # EpubHtml parses and regenerates HTML, stripping these
-                        epub_file = epub.EpubItem(
-                            file_name = filepath,
-                            content = content,
-                            media_type = 'application/xhtml+xml'
-                        )
-                        output.add_item(epub_file)
-                        # Skip nav.xhtml from spine for fixed-layout (causes blank first page)
-                        is_nav = any(x in filepath.lower() for x in ['nav.xhtml', 'nav.html', 'toc.xhtml', 'toc.html'])
-                        if not (is_nav and metadata.rendition_layout == 'pre-paginated'):
-                            # Check for spine properties (page-spread-left/right)
-                            # Try matching with different path variations
-                            props = None
-                            for href, prop_value in spine_properties.items():
-                                if filepath.endswith(href) or href.endswith(os.path.basename(filepath)):
-                                    props = prop_value
-                                    break
-                            if props:
-                                output.spine.append((epub_file, props))
+
+                        # Collect CSS files, merging content from all parts
+                        for info in css_infos:
+                            filepath = info.filename
+                            content = zipfile.read(info)
+                            if not content:
+                                continue  # Skip empty files
+                            # Kept as text until all parts are merged
+                            css = content.decode('utf-8', errors='surrogateescape')
+                            if filepath not in css_cache:
+                                css_cache[filepath] = css
                             else:
-                                output.spine.append(epub_file)
-                        if is_in_toc:
-                            output.toc.append(epub_file)
-                    else:
-                        epub_file = epub.EpubItem(
-                            file_name = filepath,
-                            content = content
-                        )
-                        output.add_item(epub_file)
-                    added_files[filepath] = file_size
-            if update:
-                update(progress)
-        os.remove(temporary_file_location)
+                                css_cache[filepath] = _merge_css(css_cache[filepath], css)
+
+                        # CSS files are added after all parts are merged
+                        for info in content_infos:
+                            if not should_add_file(info):
+                                continue
+                            filepath = info.filename
+                            content = zipfile.read(info)
+                            file_size = len(content)
+                            if filepath.endswith("html"):
+                                filename = os.path.basename(filepath)
+                                # Fix fixed-layout pages if we have rendition:layout
+                                if metadata.rendition_layout == 'pre-paginated':
+                                    # Find matching CSS (e.g., page1.xhtml -> page1.css)
+                                    css_path = filepath.replace('.xhtml', '.css').replace('.html', '.css')
+                                    css_content = css_cache.get(css_path)
+                                    if css_content:
+                                        content = _fix_fixed_layout_page(content, css_content)
+                                is_in_toc = filename in toc_filenames
+                                # Use EpubItem to preserve original content (link tags, viewport, etc.)
+                                # EpubHtml parses and regenerates HTML, stripping these
+                                epub_file = epub.EpubItem(
+                                    file_name = filepath,
+                                    content = content,
+                                    media_type = 'application/xhtml+xml'
+                                )
+                                output.add_item(epub_file)
+                                # Skip nav.xhtml from spine for fixed-layout (causes blank first page)
+                                is_nav = any(x in filepath.lower() for x in ['nav.xhtml', 'nav.html', 'toc.xhtml', 'toc.html'])
+                                if not (is_nav and metadata.rendition_layout == 'pre-paginated'):
+                                    # Check for spine properties (page-spread-left/right)
+                                    props = spine_properties.get(filename)
+                                    if props:
+                                        output.spine.append((epub_file, props))
+                                    else:
+                                        output.spine.append(epub_file)
+                                if is_in_toc:
+                                    output.toc.append(epub_file)
+                            elif filepath in binary_items:
+                                # Replace content of the existing item instead of adding a duplicate
+                                binary_items[filepath].content = content
+                            else:
+                                binary_items[filepath] = epub.EpubItem(
+                                    file_name = filepath,
+                                    content = content
+                                )
+                            added_files[filepath] = file_size
+                finally:
+                    if isinstance(part, str):
+                        os.remove(part)
+                if update:
+                    update(progress)
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.exception() is None:
+                    # Remove parts that were downloaded but never processed
+                    leftover = task.result()
+                    if isinstance(leftover, str):
+                        os.remove(leftover)
+
+        # Add binary assets once, after all parts have been processed
+        for epub_file in binary_items.values():
+            output.add_item(epub_file)
 
         # Add merged CSS files after all parts have been processed
         for css_path, css_content in css_cache.items():
             css_item = epub.EpubItem(
                 file_name=css_path,
-                content=css_content,
+                content=css_content.encode('utf-8', errors='surrogateescape'),
                 media_type='text/css'
             )
             output.add_item(css_item)
@@ -404,28 +517,27 @@ class Epub(OutputFormat):
             if first_page and hasattr(first_page, 'content') and first_page.content:
                 # Parse HTML to find all images and pick the largest one
                 try:
-                    content = first_page.content.decode('utf-8') if isinstance(first_page.content, bytes) else first_page.content
-                    img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', content)
+                    content = first_page.content.encode('utf-8') if isinstance(first_page.content, str) else first_page.content
+                    # Search the raw page and only decode the matched sources
+                    img_matches = [src.decode('utf-8') for src in _IMG_SRC_RE.findall(content)]
                     if img_matches:
                         page_dir = os.path.dirname(first_page.file_name)
-                        # Build lookup dict for item sizes
-                        item_sizes = {
-                            item.file_name: len(item.content)
-                            for item in output.items
-                            if hasattr(item, 'file_name') and item.file_name
-                            and hasattr(item, 'content') and item.content
-                        }
+                        # Build lookup dicts for item sizes by normalized path and by file name
+                        item_sizes: dict[str, int] = {}
+                        item_sizes_by_name: dict[str, int] = {}
+                        for item in output.items:
+                            if hasattr(item, 'file_name') and item.file_name \
+                                    and hasattr(item, 'content') and item.content:
+                                item_sizes[os.path.normpath(item.file_name)] = len(item.content)
+                                item_sizes_by_name[os.path.basename(item.file_name)] = len(item.content)
                         best_img = None
                         best_size = 0
                         for img_src in img_matches:
                             img_path = os.path.normpath(os.path.join(page_dir, img_src))
-                            # Find matching item by suffix
-                            for file_name, size in item_sizes.items():
-                                if file_name.endswith(img_path):
-                                    if size > best_size:
-                                        best_size = size
-                                        best_img = img_path
-                                    break
+                            size = item_sizes.get(img_path) or item_sizes_by_name.get(os.path.basename(img_path), 0)
+                            if size > best_size:
+                                best_size = size
+                                best_img = img_path
                         if best_img:
                             cover_href = best_img
                 except (UnicodeDecodeError, AttributeError):
@@ -1,6 +1,6 @@
 from grawlix.book import Book, SingleFile, OnlineFile, ImageList, HtmlFiles, Book, OfflineFile, BookData
 from grawlix.exceptions import UnsupportedOutputFormat
-from grawlix.encryption import decrypt
+from grawlix.encryption import decrypt, stream_decryptor
 
 import httpx
 from typing import Callable, Optional
@@ -58,14 +58,19 @@ class OutputFormat:
         :param update: Update function that is called with a percentage every time a chunk is downloaded
         :returns: Content of downloaded file
         """
-        content = b""
+        chunks = []
+        # Decrypt while downloading when the encryption supports it
+        decryptor = stream_decryptor(file.encryption) if file.encryption is not None else None
         async with self._client.stream("GET", file.url, headers = file.headers, cookies = file.cookies, follow_redirects=True) as request:
             total_filesize = int(request.headers["Content-length"])
             async for chunk in request.aiter_bytes():
-                content += chunk
+                chunks.append(decryptor.update(chunk) if decryptor else chunk)
                 if update:
                     update(len(chunk)/total_filesize)
-            if file.encryption is not None:
+            if decryptor:
+                chunks.append(decryptor.finalize())
+            content = b"".join(chunks)
+            if file.encryption is not None and decryptor is None:
                 content = decrypt(content, file.encryption)
         return content
 
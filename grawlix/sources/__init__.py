@@ -14,6 +14,7 @@ from .saxo import Saxo
 from .storytel import Storytel
 from .webtoons import Webtoons
 
+from functools import lru_cache
 import re
 
 source_cache: dict[str, Source] = {}
@@ -43,13 +44,28 @@ def find_source(url: str) -> type[Source]:
     :param url: Url of book to download
     :returns: Source type for downloading url
     """
-    for cls in get_source_classes():
-        for num, match in enumerate(cls.match):
-            if re.match(match, url):
-                return cls
+    for pattern, source_cls in _source_patterns():
+        if pattern.match(url):
+            return source_cls
     raise InvalidUrl
 
 
+@lru_cache(maxsize=None)
+def _source_patterns() -> list[tuple[re.Pattern, type[Source]]]:
+    """
+    Compile url patterns of all sources once.
+    Patterns are compiled separately, so group names used in one pattern
+    can not conflict with another.
+
+    :returns: Compiled regex and source type for each url pattern
+    """
+    return [
+        (re.compile(match), cls)
+        for cls in get_source_classes()
+        for match in cls.match
+    ]
+
+
 def get_source_classes() -> list[type[Source]]:
     """
     Get all source types
@@ -5,15 +5,33 @@ from .source import Source
 
 from typing import Tuple
 from datetime import date
+import asyncio
 import uuid
 import base64
 
+import orjson
+
 LOCALE = "en_GB"
+# Number of books per series page and pages requested at the same time
+SERIES_PAGE_SIZE = 100
+SERIES_PAGE_WINDOW = 4
+# Unique device id, derived from a fixed name so it stays the same between runs
+DEVICE_ID = str(uuid.uuid3(uuid.NAMESPACE_DNS, "audiobook-dl"))
+# Headers sent with every request after login
+BASE_HEADERS = {
+    "X-Application-Id": "200",
+    "X-App-Version": "2025.12.1",
+    "X-Locale": LOCALE,
+    "X-Model": "Personal Computer",
+    "X-Device-Id": DEVICE_ID,
+    "X-OS-INFO": "Personal Computer",
+    "locale": LOCALE,
+}
 
 class Nextory(Source):
     name: str = "Nextory"
     match = [
-        r"https?://((www|catalog-\w\w).)?nextory.+"
+        r"https?://((www|catalog-\w\w)\.)?nextory.+"
     ]
     _authentication_methods = [ "login" ]
 
@@ -21,18 +39,7 @@ class Nextory(Source):
 
     async def login(self, url: str, username: str, password: str) -> None:
         # Set permanent headers
-        device_id = self._create_device_id()
-        self._client.headers.update(
-            {
-                "X-Application-Id": "200",
-                "X-App-Version": "2025.12.1",
-                "X-Locale": LOCALE,
-                "X-Model": "Personal Computer",
-                "X-Device-Id": device_id,
-                "X-OS-INFO": "Personal Computer",
-                "locale": LOCALE,
-            }
-        )
+        self._client.headers.update(BASE_HEADERS)
         # Login for account
         session_response = await self._client.post(
             "https://api.nextory.com/user/v1/sessions",
@@ -41,7 +48,7 @@ class Nextory(Source):
                 "password": password
             },
         )
-        session_response = session_response.json()
+        session_response = orjson.loads(session_response.content)
         login_token = session_response["login_token"]
         country = session_response["country"]
         self._client.headers.update(
@@ -55,7 +62,7 @@ class Nextory(Source):
         profiles_response = await self._client.get(
             "https://api.nextory.com/user/v1/me/profiles",
         )
-        profiles_response = profiles_response.json()
+        profiles_response = orjson.loads(profiles_response.content)
         profile = profiles_response["profiles"][0]
         login_key = profile["login_key"]
         authorize_response = await self._client.post(
@@ -64,17 +71,11 @@ class Nextory(Source):
                 "login_key": login_key
             }
         )
-        authorize_response = authorize_response.json()
+        authorize_response = orjson.loads(authorize_response.content)
         profile_token = authorize_response["profile_token"]
         self._client.headers.update({"X-Profile-Token": profile_token})
 
 
-    @staticmethod
-    def _create_device_id() -> str:
-        """Create unique device id"""
-        return str(uuid.uuid3(uuid.NAMESPACE_DNS, "audiobook-dl"))
-
-
     # Main download methods
 
     async def download(self, url: str) -> Result:
@@ -114,10 +115,11 @@ class Nextory(Source):
 
     async def _download_book(self, book_id: str) -> Book:
         product_data = await self._get_product_data(book_id)
-        _, format_id = self._find_format(product_data)
+        formats = self._format_index(product_data)
+        _, format_id = self._find_format(formats)
         # Nextory serves all books via epub endpoint regardless of original format
         data = await self._get_epub_data(format_id)
-        metadata = self._extract_metadata(product_data)
+        metadata = self._extract_metadata(product_data, formats)
 
         return Book(
             data = data,
@@ -135,35 +137,43 @@ class Nextory(Source):
         response = await self._client.get(
             f"https://api.nextory.com/library/v1/products/{book_id}",
         )
-        return response.json()
+        return orjson.loads(response.content)
+
+
+    @staticmethod
+    def _format_index(product_data: dict) -> dict[str, dict]:
+        """
+        Index formats of a book by type
+
+        :param product_data: Product data from Nextory API
+        :return: First format of each type
+        """
+        formats: dict[str, dict] = {}
+        for fmt in product_data.get("formats", []):
+            formats.setdefault(fmt.get("type"), fmt)
+        return formats
 
 
     @staticmethod
-    def _find_format(product_data) -> Tuple[str, str]:
+    def _find_format(formats: dict[str, dict]) -> Tuple[str, str]:
         """Find a supported book format (epub or pdf)"""
         for format_type in ("epub", "pdf"):
-            for fmt in product_data["formats"]:
-                if fmt["type"] == format_type:
-                    return (format_type, fmt["identifier"])
+            fmt = formats.get(format_type)
+            if fmt is not None:
+                return (format_type, fmt["identifier"])
         raise InvalidUrl
 
 
-    def _extract_metadata(self, product_data: dict) -> Metadata:
+    def _extract_metadata(self, product_data: dict, formats: dict[str, dict]) -> Metadata:
         """
         Extract metadata from Nextory product data
 
         :param product_data: Product data from Nextory API
+        :param formats: Formats of book indexed by type
         :return: Metadata object
         """
         # Find epub or pdf format for format-specific metadata
-        ebook_format = None
-        for fmt_type in ("epub", "pdf"):
-            for fmt in product_data.get("formats", []):
-                if fmt.get("type") == fmt_type:
-                    ebook_format = fmt
-                    break
-            if ebook_format:
-                break
+        ebook_format = formats.get("epub") or formats.get("pdf")
 
         # Basic metadata
         title = product_data.get("title", "Unknown")
@@ -226,7 +236,7 @@ class Nextory(Source):
         response = await self._client.get(
             f"https://api.nextory.com/reader/books/{epub_id}/packages/epub"
         )
-        epub_data = response.json()
+        epub_data = orjson.loads(response.content)
         encryption = AESEncryption(
             key = self._fix_key(epub_data["crypt_key"]),
             iv = self._fix_key(epub_data["crypt_iv"])
@@ -239,9 +249,10 @@ class Nextory(Source):
             )
             for part in epub_data["spines"]
         ]
-        files_in_toc = {}
-        for item in epub_data["toc"]["childrens"]: # Why is it "childrens"?
-            files_in_toc[item["src"]] = item["name"]
+        files_in_toc = {
+            item["src"]: item["name"]
+            for item in epub_data["toc"]["childrens"] # Why is it "childrens"?
+        }
         return EpubInParts(
             files,
             files_in_toc
@@ -262,17 +273,42 @@ class Nextory(Source):
         :param series_id: Id of series on Nextory
         :returns: Series data
         """
+        page = await self._get_series_page(series_id, 0)
+        products = list(page)
+        next_page = 1
+        # Only full pages can be followed by more books, so request the
+        # following pages a few at a time until a page comes back short
+        while len(page) == SERIES_PAGE_SIZE:
+            pages = await asyncio.gather(*(
+                self._get_series_page(series_id, page_number)
+                for page_number in range(next_page, next_page + SERIES_PAGE_WINDOW)
+            ))
+            next_page += SERIES_PAGE_WINDOW
+            for page in pages:
+                products.extend(page)
+                if len(page) < SERIES_PAGE_SIZE:
+                    break
+        book_ids = [book["id"] for book in products]
+        return Series(
+            title = products[0]["series"]["name"],
+            book_ids = book_ids,
+        )
+
+
+    async def _get_series_page(self, series_id: str, page: int) -> list[dict]:
+        """
+        Download a single page of books in a series
+
+        :param series_id: Id of series on Nextory
+        :param page: Page number, starting at 0
+        :returns: Products on page
+        """
         response = await self._client.get(
             f"https://api.nextory.com/discovery/v1/series/{series_id}/products",
             params = {
                 "content_type": "book",
-                "page": 0,
-                "per": 100,
+                "page": page,
+                "per": SERIES_PAGE_SIZE,
             }
         )
-        series_data = response.json()
-        book_ids = [book["id"] for book in series_data["products"]]
-        return Series(
-            title = series_data["products"][0]["series"]["name"],
-            book_ids = book_ids,
-        )
+        return orjson.loads(response.content)["products"]
@@ -17,9 +17,23 @@ class Source(Generic[T]):
     match: list[str] = []
     _authentication_methods: list[str] = []
     authenticated = False
+    # Connection pool settings for the http client
+    # Concurrent requests beyond `max_connections` wait for a free connection
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 90
 
     def __init__(self):
-        self._client = httpx.AsyncClient()
+        # HTTP/2 lets sequential API calls share a single TLS connection
+        self._client = httpx.AsyncClient(
+            http2 = self.http2,
+            limits = httpx.Limits(
+                max_connections = self.max_connections,
+                max_keepalive_connections = self.max_keepalive_connections,
+                keepalive_expiry = self.keepalive_expiry,
+            ),
+        )
 
 
     @property
@@ -1,18 +1,26 @@
 from grawlix.exceptions import DataNotFound
 
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 from functools import lru_cache
 import importlib.resources
 
 def get_arg_from_url(url: str, key: str) -> str:
-    parsed_url = urlparse(url)
-    query = parse_qs(parsed_url.query)
+    query = _parse_query(url)
     try:
         return query[key][0]
-    except:
+    except KeyError:
         raise DataNotFound
 
 
+@lru_cache(maxsize=256)
+def _parse_query(url: str) -> dict[str, list[str]]:
+    """
+    Parse query arguments of url
+    The result is cached and should not be modified
+    """
+    return parse_qs(urlsplit(url).query)
+
+
 @lru_cache
 def levenstein_distance(a: str, b: str) -> int:
     """
@@ -20,18 +28,20 @@ def levenstein_distance(a: str, b: str) -> int:
 
     https://en.wikipedia.org/wiki/Levenshtein_distance
     """
-    if len(a) == 0:
-        return len(b)
-    if len(b) == 0:
-        return len(a)
-    if a[0] == b[0]:
-        return levenstein_distance(a[1:], b[1:])
-    return 1 + min(
-        levenstein_distance(a, b[1:]), # Character is inserted
-        levenstein_distance(a[1:], b), # Character is deleted
-        levenstein_distance(a[1:], b[1:]) # Character is replaced
-    )
-
+    if len(a) < len(b):
+        a, b = b, a
+    # Only the previous row of the distance matrix is needed at any time
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1, # Character is deleted
+                current[j - 1] + 1, # Character is inserted
+                previous[j - 1] + (char_a != char_b) # Character is replaced
+            ))
+        previous = current
+    return previous[-1]
 
 
 def nearest_string(input: str, list: list[str]) -> str:
@@ -41,9 +51,11 @@ def nearest_string(input: str, list: list[str]) -> str:
     return sorted(list, key = lambda x: levenstein_distance(input, x))[0]
 
 
+@lru_cache(maxsize=32)
 def read_asset_file(path: str) -> str:
     """
     Read asset file from the grawlix module
+    Content is cached after the first read
 
     :param path: Path relative to root of grawlix module
     """